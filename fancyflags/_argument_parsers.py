@@ -17,6 +17,8 @@
 import ast
 import datetime
 import enum
+import functools
+import re
 
 from absl import flags
 
@@ -25,6 +27,10 @@ BASIC_SEQUENCE_TYPES = (list, tuple)
 # We assume a sequence contains only these types. Python has no primitive types.
 SIMPLE_TYPES = (bool, float, int, str)
 
+# Exact types are checked with a set lookup before falling back to isinstance,
+# which is only needed for subclasses of the simple types.
+_SIMPLE_TYPES_SET = frozenset(SIMPLE_TYPES)
+
 NOT_A_SIMPLE_TYPE_MESSAGE = """
 Input list contains unsupported type {{}}, however each element in a sequence
 must be a {} or {}.
@@ -38,6 +44,120 @@ Empty sequences should be given explicitly as [] or () and not as an empty
 string"""
 
 
+# String inputs longer than this are parsed without caching the result, which
+# bounds the memory held by the cache.
+_MAX_CACHED_STRING_LENGTH = 1000
+
+
+def _copy_sequence(sequence):
+  """Returns a plain list or tuple with the same elements as `sequence`."""
+  # `tuple()` returns exact tuples as they are, since they are immutable.
+  return list(sequence) if isinstance(sequence, list) else tuple(sequence)
+
+
+def _validate_simple_types(sequence):
+  """Raises a TypeError if any element of `sequence` is not a simple type."""
+  for value in sequence:
+    if type(value) not in _SIMPLE_TYPES_SET and not isinstance(
+        value, SIMPLE_TYPES
+    ):
+      raise TypeError(NOT_A_SIMPLE_TYPE_MESSAGE.format(type(value).__name__))
+
+
+# A single number or boolean in a sequence literal. Anything this does not
+# match, such as strings or nested sequences, is left to `ast.literal_eval`.
+_FLAT_ELEMENT_RE = re.compile(
+    r"[ \t]*(?:"
+    r"(?P<int>-?(?:0|[1-9][0-9]*))|"
+    r"(?P<float>-?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)|"
+    r"(?P<bool>True|False)"
+    r")[ \t]*"
+)
+
+_SEQUENCE_BRACKETS = {"[]": list, "()": tuple}
+
+
+def _parse_flat_sequence_string(argument):
+  """Parses flat sequences of numbers or booleans without building an AST.
+
+  Args:
+    argument: A string such as `"[1, 2, 3]"` or `"(0.5, True)"`.
+
+  Returns:
+    The parsed list or tuple, or None if the string is not a flat sequence of
+    numbers and booleans, in which case it should be evaluated in full.
+  """
+  argument = argument.rstrip(" \t")
+  sequence_type = _SEQUENCE_BRACKETS.get(argument[:1] + argument[-1:])
+  if sequence_type is None:
+    return None
+
+  inner = argument[1:-1]
+  if not inner.strip(" \t"):
+    return sequence_type()
+
+  elements = inner.split(",")
+  if not elements[-1].strip(" \t"):
+    # Trailing comma, e.g. `(1,)`.
+    del elements[-1]
+  elif sequence_type is tuple and len(elements) == 1:
+    # Parentheses without a comma are not a tuple, e.g. `(1)`.
+    return None
+
+  result = []
+  for element in elements:
+    match = _FLAT_ELEMENT_RE.fullmatch(element)
+    if match is None:
+      return None
+    if match["int"] is not None:
+      try:
+        result.append(int(match["int"]))
+      except ValueError:
+        # Too many digits for `int()`, leave the error to `ast.literal_eval`.
+        return None
+    elif match["float"] is not None:
+      result.append(float(match["float"]))
+    else:
+      result.append(match["bool"] == "True")
+  return sequence_type(result)
+
+
+def _literal_eval_sequence(argument):
+  """Evaluates a string as a list or tuple literal."""
+  if not argument:
+    raise ValueError(_EMPTY_STRING_ERROR_MESSAGE)
+  result = _parse_flat_sequence_string(argument)
+  if result is not None:
+    return result
+  try:
+    result = ast.literal_eval(argument)
+  except (ValueError, SyntaxError) as e:
+    raise ValueError(
+        f'Failed to parse "{argument}" as a python literal.'
+    ) from e
+
+  if not isinstance(result, BASIC_SEQUENCE_TYPES):
+    raise TypeError(
+        "Input string should represent a list or tuple, however it "
+        "evaluated as a {}.".format(type(result).__name__)
+    )
+  return result
+
+
+def _parse_sequence_string(argument):
+  """Evaluates a string as a flat list or tuple of simple Python values."""
+  result = _literal_eval_sequence(argument)
+  _validate_simple_types(result)
+  return result
+
+
+# The same strings are typically parsed several times, e.g. defaults and
+# command line overrides that get serialized and parsed again.
+_cached_parse_sequence_string = functools.lru_cache(maxsize=256)(
+    _parse_sequence_string
+)
+
+
 class SequenceParser(flags.ArgumentParser):
   """Parser of simple sequences containing simple Python values."""
 
@@ -61,32 +181,19 @@ class SequenceParser(flags.ArgumentParser):
     if argument is None:
       return []
     elif isinstance(argument, BASIC_SEQUENCE_TYPES):
-      result = argument[:]
+      result = _copy_sequence(argument)
+      # Make sure the result is a flat sequence of simple types.
+      _validate_simple_types(result)
+      return result
     elif isinstance(argument, str):
-      if not argument:
-        raise ValueError(_EMPTY_STRING_ERROR_MESSAGE)
-      try:
-        result = ast.literal_eval(argument)
-      except (ValueError, SyntaxError) as e:
-        raise ValueError(
-            f'Failed to parse "{argument}" as a python literal.'
-        ) from e
-
-      if not isinstance(result, BASIC_SEQUENCE_TYPES):
-        raise TypeError(
-            "Input string should represent a list or tuple, however it "
-            "evaluated as a {}.".format(type(result).__name__)
-        )
+      if len(argument) > _MAX_CACHED_STRING_LENGTH:
+        return _parse_sequence_string(argument)
+      # Cached results are shared between calls, so return a copy. The elements
+      # are immutable, so a shallow copy is enough.
+      return _cached_parse_sequence_string(argument)[:]
     else:
       raise TypeError("Unsupported type {}.".format(type(argument).__name__))
 
-    # Make sure the result is a flat sequence of simple types.
-    for value in result:
-      if not isinstance(value, SIMPLE_TYPES):
-        raise TypeError(NOT_A_SIMPLE_TYPE_MESSAGE.format(type(value).__name__))
-
-    return result
-
   def flag_type(self):
     """See base class."""
     return "sequence"
@@ -107,6 +214,25 @@ class MultiEnumParser(flags.ArgumentParser):
 
     super().__init__()
     self.enum_values = enum_values
+    # Hashable enum values are found with a set lookup, so only unhashable ones
+    # such as lists or dicts need to be compared one by one.
+    self._hashable_enum_values = set()
+    self._unhashable_enum_values = []
+    for value in enum_values:
+      try:
+        self._hashable_enum_values.add(value)
+      except TypeError:
+        self._unhashable_enum_values.append(value)
+    self._enum_values_str = "|".join(str(value) for value in enum_values)
+
+  def _is_enum_value(self, value):
+    try:
+      if value in self._hashable_enum_values:
+        return True
+    except TypeError:
+      # `value` is unhashable, so compare it to each enum value instead.
+      return value in self.enum_values
+    return value in self._unhashable_enum_values
 
   def parse(self, arguments):
     """Determines validity of arguments.
@@ -124,25 +250,17 @@ class MultiEnumParser(flags.ArgumentParser):
     if arguments is None:
       return []
     elif isinstance(arguments, BASIC_SEQUENCE_TYPES):
-      result = arguments[:]
+      result = _copy_sequence(arguments)
     elif isinstance(arguments, enum.EnumMeta):
       result = arguments
     elif isinstance(arguments, str):
-      result = ast.literal_eval(arguments)
-
-      if not isinstance(result, BASIC_SEQUENCE_TYPES):
-        raise TypeError(
-            "Input string should represent a list or tuple, however it "
-            "evaluated as a {}.".format(type(result).__name__)
-        )
+      result = _literal_eval_sequence(arguments)
     else:
       raise TypeError("Unsupported type {}.".format(type(arguments).__name__))
 
-    if not all(arg in self.enum_values for arg in result):
+    if not all(self._is_enum_value(arg) for arg in result):
       raise ValueError(
-          "Argument values should be one of <{}>".format(
-              "|".join(str(value) for value in self.enum_values)
-          )
+          "Argument values should be one of <{}>".format(self._enum_values_str)
       )
     else:
       return result
@@ -14,7 +14,9 @@
 # ============================================================================
 """Tests for argument_parsers."""
 
+import ast
 import datetime
+import sys
 
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -27,9 +29,11 @@ TZINFO_4HRS = datetime.timezone(datetime.timedelta(hours=4))
 
 class SequenceParserTest(parameterized.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    self.parser = _argument_parsers.SequenceParser()
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # Parsers hold no per-parse state, so one instance is shared by all tests.
+    cls.parser = _argument_parsers.SequenceParser()
 
   @parameterized.parameters(
       ([1, 2, 3],),
@@ -70,6 +74,36 @@ class SequenceParserTest(parameterized.TestCase):
     result = self.parser.parse(input_string)
     self.assertEqual(result, expected)
 
+  def test_parse_input_string_repeated(self):
+    # Mutating a parsed result should not affect later results for the same
+    # input string.
+    first = self.parser.parse("[1, 2, 3]")
+    first.append(4)
+    second = self.parser.parse("[1, 2, 3]")
+    self.assertEqual(second, [1, 2, 3])
+    self.assertIsNot(first, second)
+
+  @parameterized.parameters(
+      "[1, 2, 3]",
+      "(1,)",
+      "[1,]",
+      "( )",
+      "[-0, 10]",
+      "[1., .5, 2.5e-3, 1.5E+3]",
+      "[True, False, 1]",
+      "[ 1 ,\t2 ]  ",
+      "[00]",
+      "[1_000]",
+      "[1\n,2]",
+      "['a', 1]",
+  )
+  def test_parse_input_string_matches_literal_eval(self, input_string):
+    result = self.parser.parse(input_string)
+    expected = ast.literal_eval(input_string)
+    self.assertEqual(result, expected)
+    self.assertEqual(type(result), type(expected))
+    self.assertEqual([type(v) for v in result], [type(v) for v in expected])
+
   def test_parse_none(self):
     result = self.parser.parse(None)
     self.assertEqual(result, [])
@@ -115,24 +149,44 @@ class SequenceParserTest(parameterized.TestCase):
       # SyntaxError from ast.literal_eval
       "['foo', 'bar'",
       "[1 2]",
+      "[,]",
+      "[1,,2]",
+      "[01]",
   )
   def test_parse_string_literal_error(self, input_string):
     with self.assertRaisesRegex(ValueError, ".*as a python literal.*"):
       self.parser.parse(input_string)
 
+  @absltest.skipIf(
+      condition=not hasattr(sys, "set_int_max_str_digits"),
+      reason="Integer string conversion has no length limit",
+  )
+  def test_parse_string_exceeds_int_max_str_digits(self):
+    self.addCleanup(sys.set_int_max_str_digits, sys.get_int_max_str_digits())
+    sys.set_int_max_str_digits(4300)
+    with self.assertRaisesRegex(ValueError, ".*as a python literal.*"):
+      self.parser.parse("[{}]".format("1" * 5000))
+
 
 class MultiEnumParserTest(parameterized.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    self.parser = _argument_parsers.MultiEnumParser(
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls.parser = _argument_parsers.MultiEnumParser(
         ["a", "a", ["a"], "b", "c", 1, [2], {"a": "d"}]
     )
+    cls.hashable_parser = _argument_parsers.MultiEnumParser(
+        ["a", "b", "c", 1, 2]
+    )
 
   @parameterized.parameters(
       ('["a"]', ["a"]),
       ('[["a"], "a"]', [["a"], "a"]),
       ('[1, "a", {"a": "d"}]', [1, "a", {"a": "d"}]),
+      ("[1, 1]", [1, 1]),
+      ("[]", []),
+      ("()", ()),
   )
   def test_parse_input(self, inputs, target):
     self.assertEqual(self.parser.parse(inputs), target)
@@ -147,6 +201,11 @@ class MultiEnumParserTest(parameterized.TestCase):
     with self.assertRaisesRegex(TypeError, regex):
       self.parser.parse(input_item)
 
+  @parameterized.parameters("", "[a]", '["a"')
+  def test_parse_string_literal_error(self, input_string):
+    with self.assertRaises(ValueError):
+      self.parser.parse(input_string)
+
   @parameterized.parameters("[1, 2]", '["a", ["b"]]')
   def test_out_of_enum_values(self, inputs):
     with self.assertRaisesRegex(ValueError, "Argument values should be one of"):
@@ -155,12 +214,29 @@ class MultiEnumParserTest(parameterized.TestCase):
     with self.assertRaisesRegex(ValueError, "Argument values should be one of"):
       self.parser.parse(inputs)
 
+  @parameterized.parameters(
+      ('["a", "c"]', ["a", "c"]),
+      ("[1, 2]", [1, 2]),
+      ("(True,)", (True,)),
+  )
+  def test_parse_hashable_enum_values(self, inputs, target):
+    self.assertEqual(self.hashable_parser.parse(inputs), target)
+
+  @parameterized.parameters('["d"]', "[[1]]", '[{"a": 1}]')
+  def test_out_of_hashable_enum_values(self, inputs):
+    with self.assertRaisesRegex(ValueError, "Argument values should be one of"):
+      self.hashable_parser.parse(inputs)
+
 
 class PossiblyNaiveDatetimeFlagTest(parameterized.TestCase):
 
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls.parser = _argument_parsers.PossiblyNaiveDatetimeParser()
+
   def test_parser_flag_type(self):
-    parser = _argument_parsers.PossiblyNaiveDatetimeParser()
-    self.assertEqual("datetime.datetime", parser.flag_type())
+    self.assertEqual("datetime.datetime", self.parser.flag_type())
 
   @parameterized.named_parameters(
       dict(
@@ -195,17 +271,15 @@ class PossiblyNaiveDatetimeFlagTest(parameterized.TestCase):
       ),
   )
   def test_parse(self, value, expected):
-    parser = _argument_parsers.PossiblyNaiveDatetimeParser()
-    result = parser.parse(value)
+    result = self.parser.parse(value)
 
     self.assertIsInstance(result, datetime.datetime)
     self.assertEqual(expected, result)
 
   def test_parse_separator_plus_or_minus_raises(self):
-    parser = _argument_parsers.PossiblyNaiveDatetimeParser()
     with self.assertRaisesRegex(ValueError, r"separator between date and time"):
       # Avoid confusion of 1970-01-01T08:00:00 vs. 1970-01-01T00:00:00-08:00
-      parser.parse("1970-01-01-08:00")
+      self.parser.parse("1970-01-01-08:00")
 
 
 if __name__ == "__main__":
@@ -20,8 +20,9 @@ import functools
 import inspect
 import sys
 import typing
-from typing import Any, Callable, Collection, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Collection, List, Mapping, MutableMapping, NamedTuple, Optional, Sequence, Tuple
 import warnings
+import weakref
 
 from fancyflags import _definitions
 
@@ -72,14 +73,62 @@ if sys.version_info >= (3, 9):
 _TYPE_MAP.update({Optional[tp]: parser for tp, parser in _TYPE_MAP.items()})
 
 _MISSING_TYPE_ANNOTATION = "Missing type annotation for argument {name!r}"
-_UNSUPPORTED_ARGUMENT_TYPE = (
-    "No matching flag type for argument {{name!r}} with type annotation: "
-    "{{annotation}}\n"
-    "Supported types:\n{}".format("\n".join(str(t) for t in _TYPE_MAP))
-)
 _MISSING_DEFAULT_VALUE = "Missing default value for argument {name!r}"
-_is_enum = lambda type_: inspect.isclass(type_) and issubclass(type_, enum.Enum)
-_is_unsupported_type = lambda type_: not (type_ in _TYPE_MAP or _is_enum(type_))
+
+
+@functools.lru_cache(maxsize=None)
+def _supported_types() -> str:
+  # Only built when first needed for an error message, not at import.
+  return "\n".join(str(t) for t in _TYPE_MAP)
+
+
+def _unsupported_argument_type(name: str, annotation: Any) -> str:
+  return (
+      f"No matching flag type for argument {name!r} with type annotation: "
+      f"{annotation}\nSupported types:\n{_supported_types()}"
+  )
+
+
+class _ParamPlan(NamedTuple):
+  """How `auto` handles a parameter: the `Item` to build, or a warning."""
+
+  name: str
+  item_constructor: Optional[Callable[..., _definitions.Item]] = None
+  default: Any = None
+  required: bool = False
+  warning: Optional[str] = None
+
+
+# Plans built by `auto`, keyed by the inspected function and then by
+# `(is_class, strict, skip_params)`. Weak keys let the entries be freed along
+# with their functions.
+_PLAN_CACHE = weakref.WeakKeyDictionary()
+
+# Resolved parameters of each inspected function, shared by its `auto` plans.
+_PARAMETERS_CACHE = weakref.WeakKeyDictionary()
+
+
+def _is_enum(type_: Any) -> bool:
+  return isinstance(type_, type) and issubclass(type_, enum.Enum)
+
+
+def _needs_resolution(param: inspect.Parameter) -> bool:
+  """Returns whether `param` needs `typing.get_type_hints`."""
+  annotation = param.annotation
+  if annotation is inspect.Parameter.empty:
+    return False
+  # Before Python 3.11, `typing.get_type_hints` wraps the annotations of
+  # parameters that default to None in `Optional`.
+  if sys.version_info < (3, 11) and param.default is None:
+    return True
+  # Plain classes are already resolved, but generics may contain strings, e.g.
+  # `List["int"]`, or need unwrapping, e.g. `Annotated[int, ...]`.
+  if isinstance(annotation, type) and not typing.get_args(annotation):
+    return False
+  try:
+    return annotation not in _TYPE_MAP
+  except TypeError:  # Unhashable annotation.
+    return True
 
 
 def get_typed_signature(fn: Callable[..., Any]) -> inspect.Signature:
@@ -97,18 +146,27 @@ def get_typed_signature(fn: Callable[..., Any]) -> inspect.Signature:
   Returns:
     An instance of `inspect.Signature`.
   """
-  type_hints = typing.get_type_hints(fn) or {}
   orig_signature = inspect.signature(fn)
+  if not any(
+      _needs_resolution(param) for param in orig_signature.parameters.values()
+  ):
+    return orig_signature
+
+  type_hints = typing.get_type_hints(fn) or {}
+  if not type_hints:
+    return orig_signature
   new_params = []
-  for key, orig_param in orig_signature.parameters.items():
-    new_params.append(
-        inspect.Parameter(
-            name=key,
-            default=orig_param.default,
-            annotation=type_hints.get(key, orig_param.annotation),
-            kind=orig_param.kind,
-        )
-    )
+  changed = False
+  for orig_param in orig_signature.parameters.values():
+    annotation = type_hints.get(orig_param.name, orig_param.annotation)
+    if annotation is orig_param.annotation:
+      # Only replace the parameters whose annotations were resolved.
+      new_params.append(orig_param)
+    else:
+      new_params.append(orig_param.replace(annotation=annotation))
+      changed = True
+  if not changed:
+    return orig_signature
   return orig_signature.replace(parameters=new_params)
 
 
@@ -129,6 +187,9 @@ def auto(
   ff.DEFINE_dict('my_class_settings', **ff.auto(my_module.MyClass))
   ```
 
+  The signature of `callable_fn` is only inspected the first time it is passed
+  to `auto`, so later changes to it, e.g. to its default values, are ignored.
+
   Args:
     callable_fn: Generates flag definitions from this callable's signature. All
       arguments must have type annotations and default values. The following
@@ -155,52 +216,110 @@ def auto(
   if not callable(callable_fn):
     raise TypeError(f"Not a callable: {callable_fn}.")
 
+  # Classes are keyed by their `__init__`, since that is what gets inspected.
+  is_class = isinstance(callable_fn, type)
+  inspected_fn = callable_fn.__init__ if is_class else callable_fn
+  try:
+    cached_plans = _PLAN_CACHE.setdefault(inspected_fn, {})
+  except TypeError:
+    # `inspected_fn` can't be weakly referenced, so its plans aren't cached.
+    cached_plans = {}
+  # Also used for constant-time lookups when skipping parameters.
+  skip_params = frozenset(skip_params)
+  key = (is_class, strict, skip_params)
+  if key not in cached_plans:
+    cached_plans[key] = _build_plan(
+        callable_fn, strict=strict, skip_params=skip_params
+    )
+
+  # New `Item`s are built on every call, so callers can't modify cached state.
+  items: MutableMapping[str, _definitions.Item] = {}
+  for param_plan in cached_plans[key]:
+    if param_plan.warning is not None:
+      warnings.warn(param_plan.warning)
+      continue
+    # TODO(b/177673667): Parse the help string from docstring.
+    items[param_plan.name] = param_plan.item_constructor(
+        param_plan.default,
+        help_string=param_plan.name,
+        required=param_plan.required,
+    )
+  return items
+
+
+def _get_parameters(
+    callable_fn: Callable[..., Any],
+) -> Tuple[inspect.Parameter, ...]:
+  """Returns the parameters of a callable with type annotations resolved."""
   # Work around issue with metaclass-wrapped classes, such as Sonnet v2 modules.
   if isinstance(callable_fn, type):
-    signature = get_typed_signature(callable_fn.__init__)
     # Remove `self` from start of __init__ signature.
-    unused_self, *parameters = signature.parameters.values()
-  else:
-    signature = get_typed_signature(callable_fn)
-    parameters = signature.parameters.values()
+    unused_self, *parameters = _get_typed_parameters(callable_fn.__init__)
+    return tuple(parameters)
+  return _get_typed_parameters(callable_fn)
 
-  items: MutableMapping[str, _definitions.Item] = {}
-  parameters: Iterable[inspect.Parameter]
-  for param in parameters:
+
+def _get_typed_parameters(
+    fn: Callable[..., Any],
+) -> Tuple[inspect.Parameter, ...]:
+  """Returns the parameters of `get_typed_signature(fn)`, cached per `fn`."""
+  try:
+    return _PARAMETERS_CACHE[fn]
+  except (KeyError, TypeError):
+    pass
+
+  parameters = tuple(get_typed_signature(fn).parameters.values())
+  try:
+    _PARAMETERS_CACHE[fn] = parameters
+  except TypeError:
+    pass  # `fn` can't be weakly referenced, so it isn't cached.
+  return parameters
+
+
+def _build_plan(
+    callable_fn: Callable[..., Any],
+    *,
+    strict: bool,
+    skip_params: Collection[str],
+) -> Tuple[_ParamPlan, ...]:
+  """Builds the plan for the `auto` flag definitions of a callable."""
+  plan = []
+  for param in _get_parameters(callable_fn):
     if param.name in skip_params:
       continue
 
-    # Check for potential errors.
+    # Look up the corresponding Item to create, checking for potential errors.
+    item_constructor = None
+    exception = None
     if param.annotation is inspect.Signature.empty:
       exception = TypeError(_MISSING_TYPE_ANNOTATION.format(name=param.name))
-    elif _is_unsupported_type(param.annotation):
-      exception = TypeError(
-          _UNSUPPORTED_ARGUMENT_TYPE.format(
-              name=param.name, annotation=param.annotation
-          )
-      )
     else:
-      exception = None
+      item_constructor = _TYPE_MAP.get(param.annotation)
+      if item_constructor is None and _is_enum(param.annotation):
+        item_constructor = functools.partial(
+            _definitions.EnumClass, enum_class=param.annotation
+        )
+      if item_constructor is None:
+        exception = TypeError(
+            _unsupported_argument_type(param.name, param.annotation)
+        )
 
     # If we saw an error, decide whether to raise or skip based on strictness.
     if exception:
       if strict:
         raise exception
       else:
-        warnings.warn(
-            f"Caught an exception ({exception}) when defining flags for "
-            f"parameter {param}; skipping because strict=False..."
+        plan.append(
+            _ParamPlan(
+                param.name,
+                warning=(
+                    f"Caught an exception ({exception}) when defining flags "
+                    f"for parameter {param}; skipping because strict=False..."
+                ),
+            )
         )
         continue
 
-    # Look up the corresponding Item to create.
-    if _is_enum(param.annotation):
-      item_constructor = functools.partial(
-          _definitions.EnumClass, enum_class=param.annotation
-      )
-    else:
-      item_constructor = _TYPE_MAP[param.annotation]
-
     # If there is no default argument for this parameter, we set the
     # corresponding `Flag` as `required`.
     if param.default is inspect.Signature.empty:
@@ -210,11 +329,6 @@ def auto(
       default = param.default
       required = False
 
-    # TODO(b/177673667): Parse the help string from docstring.
-    items[param.name] = item_constructor(
-        default,
-        help_string=param.name,
-        required=required,
-    )
+    plan.append(_ParamPlan(param.name, item_constructor, default, required))
 
-  return items
+  return tuple(plan)
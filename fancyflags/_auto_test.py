@@ -20,8 +20,10 @@ from __future__ import annotations
 
 import abc
 import enum
+import inspect
 import sys
 from typing import List, Optional, Sequence, Tuple
+from unittest import mock
 
 from absl import flags
 from absl.testing import absltest
@@ -261,9 +263,7 @@ class AutoTest(absltest.TestCase):
 
     with self.assertRaisesWithLiteralMatch(
         TypeError,
-        _auto._UNSUPPORTED_ARGUMENT_TYPE.format(
-            name='c', annotation=Sequence[object]
-        ),
+        _auto._unsupported_argument_type('c', Sequence[object]),
     ):
       ff.auto(my_function)
 
@@ -320,6 +320,98 @@ class AutoTest(absltest.TestCase):
     items = ff.auto(my_function, skip_params={'b'})
     self.assertSetEqual(set(items.keys()), {'a'})
 
+  def test_typed_signature_resolved_annotations(self):
+    def my_function(a: int = 1, b: List[int] = (), c=None):
+      del a, b, c
+
+    # Replace the postponed string annotations with the types themselves.
+    my_function.__annotations__ = {'a': int, 'b': List[int]}
+    signature = _auto.get_typed_signature(my_function)
+    self.assertEqual(signature, inspect.signature(my_function))
+
+  def test_typed_signature_string_annotations(self):
+    def my_function(a: int = 1, b: List[int] = ()):
+      del a, b
+
+    signature = _auto.get_typed_signature(my_function)
+    self.assertEqual(signature.parameters['a'].annotation, int)
+    self.assertEqual(signature.parameters['b'].annotation, List[int])
+
+  @absltest.skipIf(
+      condition=sys.version_info < (3, 9),
+      reason='typing.Annotated requires Python >= 3.9',
+  )
+  def test_typed_signature_annotated(self):
+    from typing import Annotated  # pylint: disable=g-import-not-at-top
+
+    def my_function(a: int = 1):
+      del a
+
+    my_function.__annotations__ = {'a': Annotated[int, 'metadata']}
+    signature = _auto.get_typed_signature(my_function)
+    self.assertEqual(signature.parameters['a'].annotation, int)
+
+  def test_typed_signature_none_default(self):
+    def my_function(e: MyEnum = None):
+      del e
+
+    # Use a resolved annotation, unlike the string ones in this module.
+    my_function.__annotations__ = {'e': MyEnum}
+    signature = _auto.get_typed_signature(my_function)
+    if sys.version_info < (3, 11):
+      # `typing.get_type_hints` adds `Optional` for None defaults before 3.11.
+      expected = Optional[MyEnum]
+    else:
+      expected = MyEnum
+    self.assertEqual(signature.parameters['e'].annotation, expected)
+
+  def test_repeated_calls(self):
+    def my_function(a: int = 1, b: str = 'hi'):
+      del a, b
+
+    items = ff.auto(my_function)
+    del items['a']
+    # Modifying the returned mapping should not affect later calls.
+    self.assertSetEqual(set(ff.auto(my_function).keys()), {'a', 'b'})
+    self.assertSetEqual(
+        set(ff.auto(my_function, skip_params=('a',)).keys()), {'b'}
+    )
+    self.assertSetEqual(set(ff.auto(my_function).keys()), {'a', 'b'})
+
+  def test_repeated_calls_return_new_items(self):
+    def my_function(a: int = 1):
+      del a
+
+    items = ff.auto(my_function)
+    items['a'].default = 99
+    # Modifying a returned Item should not affect later calls.
+    self.assertEqual(ff.auto(my_function)['a'].default, 1)
+
+  def test_repeated_calls_nonstrict_warn(self):
+    def my_function(a, b: int = 3):
+      del a, b
+
+    # The warning for the skipped parameter is repeated on every call.
+    with self.assertWarnsRegex(UserWarning, 'strict=False'):
+      ff.auto(my_function, strict=False)
+    with self.assertWarnsRegex(UserWarning, 'strict=False'):
+      ff.auto(my_function, strict=False)
+
+  def test_replaced_class_init(self):
+    class MyClass:
+
+      def __init__(self, a: int = 1):
+        del a
+
+    def new_init(self, b: str = 'hi'):
+      del self, b
+
+    self.assertSetEqual(set(ff.auto(MyClass).keys()), {'a'})
+    # The parameters of the current `__init__` should be used.
+    with mock.patch.object(MyClass, '__init__', new_init):
+      self.assertSetEqual(set(ff.auto(MyClass).keys()), {'b'})
+    self.assertSetEqual(set(ff.auto(MyClass).keys()), {'a'})
+
 
 if __name__ == '__main__':
   absltest.main()
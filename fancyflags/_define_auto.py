@@ -82,7 +82,8 @@ def DEFINE_auto(  # pylint: disable=invalid-name
   arguments = _auto.auto(fn, strict=strict, skip_params=skip_params)
   # Define the individual flags.
   defaults = _definitions.define_flags(name, arguments, flag_values=flag_values)
-  help_string = help_string or f'{fn.__module__}.{fn.__name__}'
+  if help_string is None:
+    help_string = f'{fn.__module__}.{fn.__name__}'
   # Define a holder flag.
   return flags.DEFINE_flag(
       flag=_flags.AutoFlag(
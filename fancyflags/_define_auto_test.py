@@ -181,6 +181,14 @@ class DefineAutoTest(absltest.TestCase):
     self.assertEqual(flag_values['greet'].help, f'{greet.__module__}.greet')
     self.assertEqual(flag_values['point'].help, 'custom')
 
+  def test_empty_help_string(self):
+    flag_values = flags.FlagValues()
+    _define_auto.DEFINE_auto(
+        'greet', greet, help_string='', flag_values=flag_values
+    )
+    # absl substitutes its own placeholder for empty help strings.
+    self.assertEqual(flag_values['greet'].help, '(no help available)')
+
   def test_manual_nostrict_overrides_no_default(self):
     # Given a function without type hints...
     def my_function(a):